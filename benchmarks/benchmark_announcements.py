@@ -0,0 +1,109 @@
+"""Benchmark announcement rendering by replaying a recorded play-by-play feed.
+
+Run from the repository root:
+
+    python benchmarks/benchmark_announcements.py
+"""
+
+import json
+import os
+import sys
+import time
+
+ROOT_DIR = os.path.join(os.path.dirname(__file__), "..")
+sys.path.insert(0, os.path.join(ROOT_DIR, "src"))
+
+from bot_service import OFFENCE_LABELS, BotService  # noqa: E402
+
+REPLAY_PATH = os.path.join(ROOT_DIR, "tests", "play-by-play-replay.json")
+GAME_UUID = "replay"
+ROUNDS = 200
+
+
+def _load_polls() -> list[list[dict]]:
+    """Split the replay into the feeds a poller would have seen, newest first."""
+    with open(REPLAY_PATH, encoding="utf-8") as handle:
+        events = json.load(handle)
+    chronological = list(reversed(events))
+    return [list(reversed(chronological[: index + 1])) for index in range(len(chronological))]
+
+
+def _replay_context(service: BotService, polls: list[list[dict]]) -> None:
+    """Render announcements the way the service does, using the render context."""
+    service._render_contexts.pop(GAME_UUID, None)
+    service._last_event_ids.pop(GAME_UUID, None)
+    service._seed_render_context(GAME_UUID, polls[0])
+    service._render_game_start(GAME_UUID)
+    for events in polls:
+        for event in service._extract_new_events(GAME_UUID, events):
+            service._update_render_title(GAME_UUID, event)
+            if event.get("type") == "goal":
+                service._render_goal(GAME_UUID, event)
+            elif event.get("type") == "penalty":
+                service._render_penalty(GAME_UUID, event)
+    final_score = service._find_latest_score(polls[-1])
+    service._render_game_over(GAME_UUID, final_score)
+
+
+def _legacy_expand_offence(offence: str | None) -> str | None:
+    """Expand an offence code by rebuilding the table, as before the change."""
+    if not offence:
+        return None
+    offence_map = dict(OFFENCE_LABELS)
+    return offence_map.get(offence, offence)
+
+
+def _replay_legacy(service: BotService, polls: list[list[dict]]) -> None:
+    """Render announcements following the call pattern used before the render context."""
+    service._last_event_ids.pop(GAME_UUID, None)
+    matchup = service._find_latest_matchup(polls[0])
+    service._build_announcement_embed(matchup, "Game started!")
+    for events in polls:
+        for event in service._extract_new_events(GAME_UUID, events):
+            event_type = event.get("type")
+            if event_type not in {"goal", "penalty"}:
+                continue
+            team_name = service._event_team_name(event) or service._event_team_code(event)
+            score = None
+            if event_type == "goal":
+                score = service._format_score(event.get("homeGoals"), event.get("awayGoals"))
+            details = service._collect_event_details(
+                team_name, event.get("period"), event.get("time"), score
+            )
+            if event_type == "penalty":
+                offence = _legacy_expand_offence(event.get("offence"))
+                if offence:
+                    details.append(("Offence", offence))
+            label = "Goal" if event_type == "goal" else "Penalty"
+            description = service._format_event_description(label, details)
+            matchup = service._find_matchup_from_event(event)
+            service._build_announcement_embed(matchup, description)
+    final_score = service._find_latest_score(polls[-1])
+    matchup = service._find_latest_matchup(polls[-1])
+    details = [("Final score", final_score)] if final_score else []
+    description = service._format_event_description("Match over", details)
+    service._build_announcement_embed(matchup, description)
+
+
+def _time(label: str, func, service: BotService, polls: list[list[dict]]) -> None:
+    """Run a replay function repeatedly and print the mean duration."""
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        func(service, polls)
+    elapsed = (time.perf_counter() - start) / ROUNDS
+    print(f"{label}: {elapsed * 1000:.3f} ms per replay")
+
+
+def main() -> None:
+    """Replay the recorded feed with both rendering strategies."""
+    polls = _load_polls()
+    service = BotService("VLH")
+    print(f"Replaying {len(polls)} polls, {ROUNDS} rounds")
+    _time("legacy", _replay_legacy, service, polls)
+    _time("context", _replay_context, service, polls)
+    embed = service._render_game_over(GAME_UUID, service._find_latest_score(polls[-1]))
+    print(f"Final embed: {embed.title} / {embed.description!r}")
+
+
+if __name__ == "__main__":
+    main()
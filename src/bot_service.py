@@ -5,6 +5,7 @@ import json
 import logging
 import os
 import signal
+from dataclasses import dataclass
 from datetime import datetime, timezone
 
 import aiohttp
@@ -17,6 +18,29 @@ from shl_sdk import ShlApiError, ShlSdk
 logger = logging.getLogger("discord_hockey_bot")
 START_ANNOUNCE_CHANNEL_ID = 1462165235677790434
 PLAY_BY_PLAY_DIR = os.path.join(os.getcwd(), "data", "play_by_play")
+OFFENCE_LABELS = {
+    "HI-ST": "High Sticking",
+    "HOLD": "Holding",
+    "HOOK": "Hooking",
+    "TRIP": "Tripping",
+    "ROUGH": "Roughing",
+    "SLASH": "Slashing",
+    "CROSS": "Cross Checking",
+    "INTERF": "Interference",
+    "ELBOW": "Elbowing",
+    "CHARGE": "Charging",
+    "BOARD": "Boarding",
+    "KNEE": "Kneeing",
+    "UNSPORT": "Unsportsmanlike Conduct",
+    "DELAY": "Delay of Game",
+}
+
+
+@dataclass
+class GameRenderContext:
+    """Per-game data reused when rendering announcements."""
+
+    title: str | None = None
 
 
 class BotService:
@@ -35,6 +59,7 @@ class BotService:
         self._start_announced_uuids: set[str] = set()
         self._game_over_announced_uuids: set[str] = set()
         self._period_event_keys: dict[str, set[str]] = {}
+        self._render_contexts: dict[str, GameRenderContext] = {}
         self._bot: commands.Bot | None = None
 
     def create_bot(self) -> commands.Bot:
@@ -250,6 +275,7 @@ class BotService:
                     else:
                         if self._play_by_play_logging_enabled:
                             self._persist_play_by_play(game_uuid, events)
+                        self._seed_render_context(game_uuid, events)
                         await self._maybe_announce_game_start(game_uuid, events)
                         await self._handle_new_events(game_uuid, events)
                         if self._is_game_over(events):
@@ -267,6 +293,15 @@ class BotService:
             self._play_by_play_tasks.pop(game_uuid, None)
             self._last_event_ids.pop(game_uuid, None)
             self._period_event_keys.pop(game_uuid, None)
+            self._render_contexts.pop(game_uuid, None)
+
+    def _seed_render_context(self, game_uuid: str, events: list[dict]) -> None:
+        """Create the render context from the first non-empty play-by-play response."""
+        if game_uuid in self._render_contexts or not events:
+            return
+        self._render_contexts[game_uuid] = GameRenderContext(
+            title=self._find_latest_matchup(events)
+        )
 
     async def _fetch_play_by_play(self, sdk: ShlSdk, game_uuid: str) -> list[dict]:
         """Fetch play-by-play data for a game."""
@@ -292,10 +327,17 @@ class BotService:
             game_uuid,
         )
         for event in new_events:
+            self._update_render_title(game_uuid, event)
             await self._maybe_announce_event(game_uuid, event)
         for event in new_period_events:
             await self._announce_period_break(game_uuid, event)
 
+    def _update_render_title(self, game_uuid: str, event: dict) -> None:
+        """Fill a missing matchup title from a new event."""
+        context = self._render_contexts.get(game_uuid)
+        if context is not None and context.title is None:
+            context.title = self._find_matchup_from_event(event)
+
     def _extract_new_events(self, game_uuid: str, events: list[dict]) -> list[dict]:
         """Return non-period events that are newer than the last seen event ID."""
         last_event_id = self._last_event_ids.get(game_uuid)
@@ -361,10 +403,8 @@ class BotService:
                 game_uuid,
             )
             return
-        matchup = self._find_latest_matchup(events)
         self._start_announced_uuids.add(game_uuid)
-        description = "Game started!"
-        embed = self._build_announcement_embed(matchup, description)
+        embed = self._render_game_start(game_uuid)
         await channel.send(embed=embed)
 
     async def _maybe_announce_event(self, game_uuid: str, event: dict) -> None:
@@ -382,48 +422,21 @@ class BotService:
         channel = await self._get_announce_channel()
         if channel is None:
             return
-        team_name = self._event_team_name(event) or self._event_team_code(event)
-        time = event.get("time")
-        period = event.get("period")
-        home_goals = event.get("homeGoals")
-        away_goals = event.get("awayGoals")
-        score = self._format_score(home_goals, away_goals)
-        matchup = self._find_matchup_from_event(event)
-        details = self._collect_event_details(team_name, period, time, score)
-        description = self._format_event_description("Goal", details)
-        embed = self._build_announcement_embed(matchup, description)
-        await channel.send(embed=embed)
+        await channel.send(embed=self._render_goal(game_uuid, event))
 
     async def _announce_penalty(self, game_uuid: str, event: dict) -> None:
         """Announce a penalty event."""
         channel = await self._get_announce_channel()
         if channel is None:
             return
-        team_name = self._event_team_name(event) or self._event_team_code(event)
-        time = event.get("time")
-        period = event.get("period")
-        offence = self._expand_offence(event.get("offence"))
-        matchup = self._find_matchup_from_event(event)
-        details = self._collect_event_details(team_name, period, time, None)
-        if offence:
-            details.append(("Offence", offence))
-        description = self._format_event_description("Penalty", details)
-        embed = self._build_announcement_embed(matchup, description)
-        await channel.send(embed=embed)
+        await channel.send(embed=self._render_penalty(game_uuid, event))
 
     async def _announce_period_break(self, game_uuid: str, event: dict) -> None:
         """Announce the end of a period."""
         channel = await self._get_announce_channel()
         if channel is None:
             return
-        period = event.get("period")
-        matchup = self._find_matchup_from_event(event)
-        details: list[tuple[str, str]] = []
-        if period is not None:
-            details.append(("Period", str(period)))
-        description = self._format_event_description("Period break", details)
-        embed = self._build_announcement_embed(matchup, description)
-        await channel.send(embed=embed)
+        await channel.send(embed=self._render_period_break(game_uuid, event))
 
     async def _announce_game_over(self, game_uuid: str, events: list[dict]) -> None:
         """Announce final score when the game ends."""
@@ -433,14 +446,62 @@ class BotService:
         if channel is None:
             return
         final_score = self._find_latest_score(events)
-        matchup = self._find_latest_matchup(events)
+        self._game_over_announced_uuids.add(game_uuid)
+        embed = self._render_game_over(game_uuid, final_score)
+        await channel.send(embed=embed)
+
+    def _render_game_start(self, game_uuid: str) -> discord.Embed:
+        """Render the game start announcement."""
+        return self._render_announcement(game_uuid, None, "Game started!")
+
+    def _render_goal(self, game_uuid: str, event: dict) -> discord.Embed:
+        """Render a goal announcement."""
+        team_name = self._event_team_name(event) or self._event_team_code(event)
+        score = self._format_score(event.get("homeGoals"), event.get("awayGoals"))
+        details = self._collect_event_details(
+            team_name, event.get("period"), event.get("time"), score
+        )
+        description = self._format_event_description("Goal", details)
+        return self._render_announcement(game_uuid, event, description)
+
+    def _render_penalty(self, game_uuid: str, event: dict) -> discord.Embed:
+        """Render a penalty announcement."""
+        team_name = self._event_team_name(event) or self._event_team_code(event)
+        offence = self._expand_offence(event.get("offence"))
+        details = self._collect_event_details(
+            team_name, event.get("period"), event.get("time"), None
+        )
+        if offence:
+            details.append(("Offence", offence))
+        description = self._format_event_description("Penalty", details)
+        return self._render_announcement(game_uuid, event, description)
+
+    def _render_period_break(self, game_uuid: str, event: dict) -> discord.Embed:
+        """Render a period break announcement."""
+        period = event.get("period")
+        details: list[tuple[str, str]] = []
+        if period is not None:
+            details.append(("Period", str(period)))
+        description = self._format_event_description("Period break", details)
+        return self._render_announcement(game_uuid, event, description)
+
+    def _render_game_over(self, game_uuid: str, final_score: str | None) -> discord.Embed:
+        """Render the final score announcement."""
         details: list[tuple[str, str]] = []
         if final_score:
             details.append(("Final score", final_score))
         description = self._format_event_description("Match over", details)
-        self._game_over_announced_uuids.add(game_uuid)
-        embed = self._build_announcement_embed(matchup, description)
-        await channel.send(embed=embed)
+        return self._render_announcement(game_uuid, None, description)
+
+    def _render_announcement(
+        self, game_uuid: str, event: dict | None, description: str
+    ) -> discord.Embed:
+        """Render an embed titled from the game's render context."""
+        context = self._render_contexts.get(game_uuid)
+        title = context.title if context else None
+        if title is None and event is not None:
+            title = self._find_matchup_from_event(event)
+        return self._build_announcement_embed(title, description)
 
     async def _get_announce_channel(self):
         """Return the configured Discord channel if available."""
@@ -539,23 +600,7 @@ class BotService:
         """Expand an offence code to a readable label."""
         if not offence:
             return None
-        offence_map = {
-            "HI-ST": "High Sticking",
-            "HOLD": "Holding",
-            "HOOK": "Hooking",
-            "TRIP": "Tripping",
-            "ROUGH": "Roughing",
-            "SLASH": "Slashing",
-            "CROSS": "Cross Checking",
-            "INTERF": "Interference",
-            "ELBOW": "Elbowing",
-            "CHARGE": "Charging",
-            "BOARD": "Boarding",
-            "KNEE": "Kneeing",
-            "UNSPORT": "Unsportsmanlike Conduct",
-            "DELAY": "Delay of Game",
-        }
-        return offence_map.get(offence, offence)
+        return OFFENCE_LABELS.get(offence, offence)
 
     def _persist_play_by_play(self, game_uuid: str, events: list[dict]) -> None:
         """Persist play-by-play events to disk."""
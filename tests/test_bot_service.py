@@ -0,0 +1,107 @@
+"""Checks for announcement rendering against the recorded play-by-play replay."""
+
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from bot_service import BotService  # noqa: E402
+
+REPLAY_PATH = os.path.join(os.path.dirname(__file__), "play-by-play-replay.json")
+GAME_UUID = "replay"
+
+
+def _load_replay() -> list[dict]:
+    """Load the recorded feed, newest event first."""
+    with open(REPLAY_PATH, encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def _replay(service: BotService, events: list[dict]) -> None:
+    """Feed the replay to the service one poll at a time."""
+    chronological = list(reversed(events))
+    for index in range(len(chronological)):
+        feed = list(reversed(chronological[: index + 1]))
+        service._seed_render_context(GAME_UUID, feed)
+        for event in service._extract_new_events(GAME_UUID, feed):
+            service._update_render_title(GAME_UUID, event)
+
+
+def _find_event(events: list[dict], event_id: int) -> dict:
+    """Return the replay event with the given event ID."""
+    return next(event for event in events if event.get("eventId") == event_id)
+
+
+def test_final_embed_after_replay() -> None:
+    events = _load_replay()
+    service = BotService("VLH")
+    _replay(service, events)
+
+    embed = service._render_game_over(GAME_UUID, service._find_latest_score(events))
+
+    assert embed.title == "Örebro Hockey vs Växjö Lakers"
+    assert embed.description == "Match over\nFinal score: 0-1"
+
+
+def test_title_is_taken_from_first_new_event_with_teams() -> None:
+    events = _load_replay()
+    first_poll = events[-1:]
+    service = BotService("VLH")
+
+    service._seed_render_context(GAME_UUID, first_poll)
+    assert service._render_contexts[GAME_UUID].title is None
+
+    _replay(service, events)
+    assert service._render_contexts[GAME_UUID].title == "Örebro Hockey vs Växjö Lakers"
+
+
+def test_render_goal() -> None:
+    events = _load_replay()
+    service = BotService("VLH")
+
+    embed = service._render_goal(GAME_UUID, _find_event(events, 121))
+
+    assert embed.title == "Örebro Hockey vs Växjö Lakers"
+    assert embed.description == (
+        "Goal\nTeam: Växjö Lakers\nPeriod: 4\nTime: 01:46\nScore: 0-1"
+    )
+
+
+def test_render_penalty() -> None:
+    events = _load_replay()
+    service = BotService("VLH")
+
+    slashing = service._render_penalty(GAME_UUID, _find_event(events, 19))
+    unknown = service._render_penalty(GAME_UUID, _find_event(events, 42))
+
+    assert slashing.description == (
+        "Penalty\nTeam: Växjö Lakers\nPeriod: 1\nTime: 10:31\nOffence: Slashing"
+    )
+    assert unknown.description == (
+        "Penalty\nTeam: Växjö Lakers\nPeriod: 1\nTime: 19:48\nOffence: TOO-M"
+    )
+
+
+def test_title_falls_back_to_event_teams_without_context() -> None:
+    goal = next(event for event in _load_replay() if event.get("type") == "goal")
+    service = BotService("VLH")
+
+    embed = service._render_goal(GAME_UUID, goal)
+
+    assert embed.title == "Örebro Hockey vs Växjö Lakers"
+    assert GAME_UUID not in service._render_contexts
+
+
+def test_title_defaults_without_context_or_event_teams() -> None:
+    service = BotService("VLH")
+
+    assert service._render_game_start(GAME_UUID).title == "SHL Update"
+
+
+def test_expand_offence() -> None:
+    service = BotService("VLH")
+
+    assert service._expand_offence("SLASH") == "Slashing"
+    assert service._expand_offence("UNKNOWN") == "UNKNOWN"
+    assert service._expand_offence(None) is None